@@ -0,0 +1,158 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import yfinance as yf
+import plotly.graph_objects as go
+import datetime
+
+from Pages.utils.portfolio import daily_returns, return_stats, portfolio_metrics, simulate_portfolios, efficient_frontier
+
+# Setting page config
+st.set_page_config(page_title="Portfolio Analysis", page_icon="💼", layout="wide")
+
+# Title
+st.title("Portfolio Analysis 💼")
+
+# Number of simulated portfolios drawn on the frontier chart
+PLOT_POINTS = 5000
+# Seconds before cached prices (and everything derived from them) are refetched
+CACHE_TTL = 3600
+
+### === CACHED DATA & SIMULATION === ###
+@st.cache_data(show_spinner="Fetching price history...", ttl=CACHE_TTL)
+def get_close_prices(symbols, start_date, end_date):
+    """Closing prices for a (sorted) symbol tuple, one column per symbol"""
+    data = yf.download(list(symbols), start=start_date, end=end_date, progress=False)
+    close = data["Close"]
+    if isinstance(close, pd.Series):
+        close = close.to_frame(name=symbols[0])
+    return close.dropna(axis=1, how="all")
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
+def get_returns(symbols, start_date, end_date):
+    return daily_returns(get_close_prices(symbols, start_date, end_date))
+
+# Only the return/volatility vectors and the frontier weights are cached, not
+# the full weight matrix; the risk-free rate is applied outside so changing it
+# never re-simulates
+@st.cache_data(show_spinner="Simulating portfolios...", ttl=CACHE_TTL, max_entries=4)
+def run_simulation(symbols, start_date, end_date, num_portfolios):
+    """Monte Carlo frontier, cached per (symbol set, window, portfolio count)"""
+    returns = get_returns(symbols, start_date, end_date)
+    mean, cov = return_stats(returns)
+    weights, port_returns, vols = simulate_portfolios(mean, cov, num_portfolios)
+    frontier = efficient_frontier(port_returns, vols)
+    return port_returns, vols, frontier, weights[frontier]
+
+### === INPUTS === ###
+today = datetime.date.today()
+
+col1, col2, col3 = st.columns([3, 1, 1])
+
+with col1:
+    symbols_text = st.text_input("Stock Tickers (comma separated)", "AAPL, NVDA, TSLA, GOOG, TCS.NS")
+with col2:
+    start_date = st.date_input("Choose Start Date", today - datetime.timedelta(days=3 * 365))
+with col3:
+    end_date = st.date_input("Choose End Date", today)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    num_portfolios = st.select_slider("Simulated Portfolios", [10_000, 50_000, 100_000, 200_000], value=100_000)
+with col2:
+    risk_free = st.number_input("Risk-Free Rate (annual %)", min_value=0.0, max_value=20.0, value=4.0, step=0.25) / 100
+with col3:
+    confidence = st.selectbox("VaR Confidence", [0.90, 0.95, 0.99], index=1, format_func=lambda c: f"{c:.0%}")
+
+# Sorted so the same set of symbols hits the same cache entry
+symbols = tuple(sorted({s.strip().upper() for s in symbols_text.split(",") if s.strip()}))
+
+if len(symbols) < 2:
+    st.error("Please enter at least two stock tickers.")
+    st.stop()
+
+returns = get_returns(symbols, start_date, end_date)
+
+if returns.shape[1] < 2 or len(returns) < 2:
+    st.error("Not enough data found. Please check the stock tickers and date range.")
+    st.stop()
+
+missing = sorted(set(symbols) - set(returns.columns))
+if missing:
+    st.warning(f"No data found for: {', '.join(missing)}")
+
+columns = list(returns.columns)
+mean, cov = return_stats(returns)
+
+### === EQUAL-WEIGHT PORTFOLIO === ###
+st.write("### Equal-Weight Portfolio")
+metrics = portfolio_metrics(returns, np.ones(len(columns)), risk_free, confidence)
+drawdown = metrics.pop("drawdown")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+for col, (name, value) in zip([col1, col2, col3, col4, col5], metrics.items()):
+    col.metric(name, f"{value:.2f}" if name == "Sharpe Ratio" else f"{value:.2%}")
+
+fig = go.Figure()
+fig.add_trace(go.Scatter(x=drawdown.index, y=drawdown, mode="lines", fill="tozeroy", name="Drawdown", line=dict(color="red")))
+fig.update_layout(title="Portfolio Drawdown", xaxis_title="Date", yaxis_title="Drawdown", yaxis_tickformat=".0%", height=350)
+st.plotly_chart(fig, use_container_width=True)
+
+### === CORRELATION === ###
+st.write("### Returns Correlation")
+vol = np.sqrt(np.diag(cov))
+corr = cov / np.outer(vol, vol)
+fig = go.Figure(go.Heatmap(z=corr, x=columns, y=columns, zmin=-1, zmax=1, colorscale="RdBu"))
+fig.update_layout(height=max(400, 18 * len(columns)))
+st.plotly_chart(fig, use_container_width=True)
+
+### === EFFICIENT FRONTIER === ###
+st.write("### Monte Carlo Efficient Frontier")
+sim_returns, sim_vols, frontier, frontier_weights = run_simulation(symbols, start_date, end_date, num_portfolios)
+sim_sharpe = (sim_returns - risk_free) / sim_vols
+
+# Frontier portfolios are sorted by volatility, so the first is the safest
+frontier_returns, frontier_vols, frontier_sharpe = sim_returns[frontier], sim_vols[frontier], sim_sharpe[frontier]
+best = int(np.nanargmax(frontier_sharpe))
+safest = 0
+# Only a sample of the cloud is sent to the browser
+sample = np.random.default_rng(0).choice(num_portfolios, size=min(PLOT_POINTS, num_portfolios), replace=False)
+sample_returns, sample_vols, sample_sharpe = sim_returns[sample], sim_vols[sample], sim_sharpe[sample]
+
+result = {
+    "max_sharpe": (frontier_weights[best], frontier_returns[best], frontier_vols[best], frontier_sharpe[best]),
+    "min_vol": (frontier_weights[safest], frontier_returns[safest], frontier_vols[safest], frontier_sharpe[safest]),
+}
+
+fig = go.Figure()
+fig.add_trace(go.Scattergl(
+    x=sample_vols, y=sample_returns, mode="markers", name="Simulated Portfolios",
+    marker=dict(size=4, color=sample_sharpe, colorscale="Viridis", showscale=True, colorbar=dict(title="Sharpe"))
+))
+fig.add_trace(go.Scatter(
+    x=frontier_vols, y=frontier_returns, mode="lines+markers", name="Efficient Frontier",
+    line=dict(width=2, color="black"), marker=dict(size=4)
+))
+for key, label, color in [("max_sharpe", "Max Sharpe", "red"), ("min_vol", "Min Volatility", "blue")]:
+    _, ret, vol, _ = result[key]
+    fig.add_trace(go.Scatter(x=[vol], y=[ret], mode="markers", name=label, marker=dict(size=14, symbol="star", color=color)))
+fig.update_layout(xaxis_title="Annual Volatility", yaxis_title="Annual Return", xaxis_tickformat=".0%", yaxis_tickformat=".0%", height=600)
+st.plotly_chart(fig, use_container_width=True)
+
+col1, col2 = st.columns(2)
+
+for col, key, label in [(col1, "max_sharpe", "Max Sharpe Portfolio"), (col2, "min_vol", "Min Volatility Portfolio")]:
+    weights, ret, vol, sharpe = result[key]
+    with col:
+        st.write(f"#### {label}")
+        st.write(f"**Return:** {ret:.2%} &nbsp; **Volatility:** {vol:.2%} &nbsp; **Sharpe:** {sharpe:.2f}")
+        allocation = pd.DataFrame({"Weight": weights}, index=columns).sort_values("Weight", ascending=False)
+        st.dataframe(allocation.style.format("{:.2%}"), use_container_width=True)
+
+# Footer
+st.markdown("""
+    <hr>
+    <p style='text-align: center; color: grey;'>© 2025 Stock Vision. All Rights Reserved.</p>
+    <p style='text-align: center; color: grey;'>Simulated allocations are based on historical returns and do not guarantee future performance.</p>
+""", unsafe_allow_html=True)
@@ -5,6 +5,9 @@ import yfinance as yf
 import plotly.graph_objects as go
 import ta
 import datetime
+import math
+
+from Pages.utils.plotly_figure import format_table, page_bounds, plotly_table
 
 # Setting page config
 st.set_page_config(page_title="Stock Analysis", page_icon="📊", layout="wide")
@@ -104,9 +107,26 @@ else:
     col1.warning("Not enough data for daily change.")
 
 
-# Display historical data (Last 10 days)
-st.write("### Historical Data (Last 10 Days)")
-st.dataframe(data.tail(10).round(2))
+# Format the full history once per ticker/date range; pages are then array slices
+@st.cache_data(show_spinner=False)
+def get_history_table(data):
+    return format_table(data.iloc[::-1])
+
+# Display historical data (most recent first, one page at a time)
+st.write("### Historical Data")
+history_table = get_history_table(data)
+
+col1, col2, col3 = st.columns([1, 1, 3])
+
+with col1:
+    page_size = st.selectbox("Rows per Page", [10, 25, 50, 100], index=0)
+num_pages = max(math.ceil(history_table["rows"] / page_size), 1)
+with col2:
+    page = st.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, value=1)
+
+first_row, last_row = page_bounds(history_table["rows"], page - 1, page_size)
+st.plotly_chart(plotly_table(history_table, page - 1, page_size), use_container_width=True)
+st.caption(f"Showing rows {first_row + 1}-{last_row} of {history_table['rows']}")
 
 # Chart selection
 col1, col2, col3 = st.columns([1, 2, 2])
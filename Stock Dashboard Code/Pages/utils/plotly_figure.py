@@ -1,28 +1,78 @@
 import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
 import dateutil
-import pandas_ta as pta
 import datetime
-
-def plotly_table(dataframe):
+import math
+
+PAGE_SIZE = 25
+HEADER_HEIGHT = 35
+ROW_HEIGHT = 30
+
+def format_column(values, decimals=2):
+    """Format a whole column to display strings in one vectorized pass"""
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        return np.char.mod('%d', values)
+    if np.issubdtype(values.dtype, np.floating):
+        return np.where(np.isnan(values), '', np.char.mod(f'%.{decimals}f', values))
+    return values.astype(str)
+
+def format_table(dataframe, decimals=2):
+    """Precompute header and cell strings once so pages are plain array slices"""
+    columns = dataframe.columns
+    if isinstance(columns, pd.MultiIndex):
+        columns = columns.get_level_values(0)
+
+    index = dataframe.index
+    if isinstance(index, pd.DatetimeIndex):
+        index = index.strftime('%Y-%m-%d')
+
+    return {
+        'header': ["<b>Index</b>"] + ["<b>" + str(col) + "</b>" for col in columns],
+        'columns': [np.char.add(np.char.add('<b>', np.asarray(index, dtype=str)), '</b>')]
+                   + [format_column(dataframe.iloc[:, i].to_numpy(), decimals) for i in range(dataframe.shape[1])],
+        'rows': len(dataframe),
+    }
+
+def page_bounds(rows, page, page_size=PAGE_SIZE):
+    """Row range of a page, clamped to the last page"""
+    last_page = max(math.ceil(rows / page_size) - 1, 0)
+    start = min(max(page, 0), last_page) * page_size
+    return start, min(start + page_size, rows)
+
+def plotly_table(table, page=0, page_size=PAGE_SIZE, height=None):
+    """Render one page of a DataFrame or of a table built by format_table.
+
+    By default the figure is sized to fit the page's rows exactly.
+    """
     header_color = '#0078ff'
     row_even_color = '#f8fafd'
     row_odd_color = '#e1efff'
 
+    if not isinstance(table, dict):
+        table = format_table(table)
+    start, stop = page_bounds(table['rows'], page, page_size)
+    # Colour by absolute row number so stripes line up across pages
+    fill_color = np.where(np.arange(start, stop) % 2 == 0, row_odd_color, row_even_color)
+
     fig = go.Figure(data=[go.Table(
         header=dict(
-            values=["<b>Index</b>"] + ["<b>" + str(col) + "</b>" for col in dataframe.columns],
+            values=table['header'],
             line_color=header_color, fill_color=header_color,
-            align='center', font=dict(color='white', size=14), height=35
+            align='center', font=dict(color='white', size=14), height=HEADER_HEIGHT
         ),
         cells=dict(
-            values=[[f"<b>{idx}</b>" for idx in dataframe.index]] + [dataframe[col].tolist() for col in dataframe.columns],
-            fill_color=[[row_odd_color, row_even_color] * (len(dataframe) // 2) + [row_odd_color] * (len(dataframe) % 2)],
+            values=[column[start:stop] for column in table['columns']],
+            fill_color=[fill_color],
             align='left', line_color='white',
-            font=dict(color="black", size=13)
+            font=dict(color="black", size=13), height=ROW_HEIGHT
         )
     )])
 
-    fig.update_layout(height=400, margin=dict(l=0, r=0, t=0, b=0))
+    if height is None:
+        height = HEADER_HEIGHT + ROW_HEIGHT * (stop - start)
+    fig.update_layout(height=height, margin=dict(l=0, r=0, t=0, b=0))
     return fig
 
 def filter_data(dataframe, num_period): 
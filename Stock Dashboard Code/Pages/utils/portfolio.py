@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+
+def daily_returns(prices):
+    """Simple daily returns of a price frame (one column per symbol)"""
+    # Exchanges with different holidays leave gaps; carry the last close forward
+    return prices.sort_index().ffill().pct_change(fill_method=None).dropna(axis=1, how="all").dropna()
+
+
+def return_stats(returns):
+    """Annualised mean return vector and covariance matrix as NumPy arrays"""
+    values = returns.to_numpy(dtype=np.float64)
+    mean = values.mean(axis=0) * TRADING_DAYS
+    cov = np.cov(values, rowvar=False) * TRADING_DAYS
+    return mean, np.atleast_2d(cov)
+
+
+def portfolio_metrics(returns, weights, risk_free=0.0, confidence=0.95):
+    """Volatility, drawdown, VaR and Sharpe ratio for a single weight vector"""
+    weights = np.asarray(weights, dtype=np.float64)
+    weights = weights / weights.sum()
+
+    port_returns = returns.to_numpy(dtype=np.float64) @ weights
+    mean, cov = return_stats(returns)
+
+    annual_return = float(mean @ weights)
+    annual_vol = float(np.sqrt(weights @ cov @ weights))
+    sharpe = (annual_return - risk_free) / annual_vol if annual_vol > 0 else np.nan
+
+    wealth = np.cumprod(1.0 + port_returns)
+    # Seed the running peak with the starting value so a first-day loss counts
+    drawdown = wealth / np.maximum.accumulate(np.maximum(wealth, 1.0)) - 1.0
+
+    # Historical one-day VaR, reported as a positive loss
+    var = -float(np.quantile(port_returns, 1.0 - confidence))
+
+    return {
+        "Annual Return": annual_return,
+        "Annual Volatility": annual_vol,
+        "Sharpe Ratio": sharpe,
+        "Max Drawdown": float(drawdown.min()),
+        f"1-Day VaR ({confidence:.0%})": var,
+        "drawdown": pd.Series(drawdown, index=returns.index, name="Drawdown"),
+    }
+
+
+def random_weights(num_portfolios, num_assets, rng, alphas=(1.0, 0.1)):
+    """Long-only weights from an even mix of Dirichlet draws.
+
+    alpha=1 samples the simplex uniformly; alpha<1 gives sparse, concentrated
+    portfolios. Normalising uniform draws instead would cluster every
+    portfolio around equal weight once there are more than a few assets.
+    """
+    sizes = np.diff(np.linspace(0, num_portfolios, len(alphas) + 1).astype(int))
+    return np.vstack([rng.dirichlet(np.full(num_assets, alpha), size) for alpha, size in zip(alphas, sizes)])
+
+
+def simulate_portfolios(mean, cov, num_portfolios=100_000, seed=42):
+    """Random long-only weights evaluated in one pass of matrix products"""
+    rng = np.random.default_rng(seed)
+    weights = random_weights(num_portfolios, len(mean), rng)
+
+    returns = weights @ mean
+    # Row-wise w' C w without building an (n x n) matrix
+    vols = np.sqrt(np.einsum("ij,ij->i", weights @ cov, weights))
+
+    return weights, returns, vols
+
+
+def efficient_frontier(returns, vols):
+    """Indices of the simulated portfolios on the upper frontier, by volatility.
+
+    A portfolio is kept when no lower-volatility portfolio has a higher
+    return. The min-volatility portfolio is always among them, as is the
+    max-Sharpe portfolio whenever its excess return is positive.
+    """
+    order = np.argsort(vols, kind="stable")
+    ordered_returns = returns[order]
+    best_so_far = np.maximum.accumulate(ordered_returns)
+    is_new_high = np.concatenate([[True], ordered_returns[1:] > best_so_far[:-1]])
+    return order[is_new_high]
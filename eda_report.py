@@ -0,0 +1,294 @@
+"""Static HTML EDA report for an arbitrary list of stock symbols.
+
+Runs the analyses from Final_EDA.ipynb (price history, volume, moving averages,
+daily returns, correlation, risk vs. return) from a local per-symbol price cache.
+Symbols are processed in parallel and each history is read in chunks, so only
+running totals and weekly-resampled series are kept in memory. Correlation is
+computed from weekly returns for the same reason. A symbol that fails to
+download or parse is skipped rather than aborting the report.
+
+Usage:
+    python eda_report.py AAPL NVDA TSLA TCS.NS --output eda_report.html
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import yfinance as yf
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+MA_WINDOWS = [20, 50, 200]
+TRADING_DAYS = 252
+WEEKS_PER_YEAR = 52
+# Fixed bins so return histograms can be accumulated chunk by chunk
+RETURN_BINS = np.linspace(-0.2, 0.2, 81)
+
+
+### === PRICE CACHE === ###
+def cache_path(cache_dir, symbol):
+    return os.path.join(cache_dir, f"{symbol}.csv")
+
+def download_history(symbol, cache_dir, refresh=False):
+    """Fetch the maximum available history once and store it in the cache"""
+    path = cache_path(cache_dir, symbol)
+    if os.path.exists(path) and not refresh:
+        return True
+    try:
+        data = yf.Ticker(symbol).history(period="max")
+        if data.empty:
+            return False
+        data = data[PRICE_COLUMNS]
+        data.index = pd.to_datetime(data.index).tz_localize(None)
+        data.index.name = "Date"
+        # Write then rename so an interrupted download never looks cached
+        partial = f"{path}.part"
+        data.to_csv(partial)
+        os.replace(partial, path)
+    except Exception as error:
+        print(f"Download failed for {symbol}: {error}")
+        return False
+    return True
+
+def fill_cache(symbols, cache_dir, refresh=False, workers=8):
+    """Download missing symbols concurrently, returning those with data"""
+    os.makedirs(cache_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        found = list(pool.map(lambda s: download_history(s, cache_dir, refresh), symbols))
+    return [symbol for symbol, ok in zip(symbols, found) if ok]
+
+
+### === STREAMING ANALYSIS === ###
+def analyse_symbol(symbol, cache_dir, chunk_size=5000):
+    """Summarise one symbol, or None if its cached history can't be read"""
+    try:
+        return summarise_history(symbol, cache_dir, chunk_size)
+    except Exception as error:
+        print(f"Analysis failed for {symbol}: {error}")
+        return None
+
+def summarise_history(symbol, cache_dir, chunk_size=5000):
+    """Read one cached history in chunks and return its compact summary"""
+    carry = None
+    weekly_prices, weekly_volume = [], []
+    count, mean, m2 = 0, 0.0, 0.0
+    min_return, max_return = np.inf, -np.inf
+    hist = np.zeros(len(RETURN_BINS) - 1, dtype=np.int64)
+    first_date = last_date = None
+    first_close = last_close = None
+
+    chunks = pd.read_csv(cache_path(cache_dir, symbol), index_col="Date", parse_dates=["Date"], chunksize=chunk_size)
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=["Close"])
+        if chunk.empty:
+            continue
+        if first_close is None:
+            first_date, first_close = chunk.index[0], float(chunk["Close"].iloc[0])
+        last_date, last_close = chunk.index[-1], float(chunk["Close"].iloc[-1])
+
+        # Prepend the tail of the previous chunk so rolling windows and
+        # returns continue across chunk boundaries
+        close = chunk["Close"] if carry is None else pd.concat([carry, chunk["Close"]])
+        offset = 0 if carry is None else len(carry)
+        frame = pd.DataFrame({"Close": close})
+        for window in MA_WINDOWS:
+            frame[f"MA {window}"] = close.rolling(window).mean()
+        frame = frame.iloc[offset:]
+        daily = close.pct_change(fill_method=None).iloc[offset:].dropna()
+        carry = close.iloc[-(max(MA_WINDOWS) - 1):]
+
+        weekly_prices.append(frame.resample("W").last())
+        weekly_volume.append(chunk["Volume"].resample("W").sum())
+
+        values = daily.to_numpy()
+        if len(values):
+            # Merge this chunk's mean and M2 into the running totals
+            # (Chan et al. parallel variance update)
+            chunk_count = len(values)
+            chunk_mean = values.mean()
+            chunk_m2 = np.square(values - chunk_mean).sum()
+            delta = chunk_mean - mean
+            merged = count + chunk_count
+            mean += delta * chunk_count / merged
+            m2 += chunk_m2 + delta ** 2 * count * chunk_count / merged
+            count = merged
+
+            min_return = min(min_return, values.min())
+            max_return = max(max_return, values.max())
+            hist += np.histogram(np.clip(values, RETURN_BINS[0], RETURN_BINS[-1]), RETURN_BINS)[0]
+
+    if count < 2:
+        return None
+
+    # Weeks split across two chunks appear twice; merge them
+    prices = pd.concat(weekly_prices).groupby(level=0).last()
+    volume = pd.concat(weekly_volume).groupby(level=0).sum()
+    std = np.sqrt(m2 / (count - 1))
+
+    return {
+        "symbol": symbol,
+        "prices": prices,
+        "volume": volume,
+        "hist": hist,
+        "stats": {
+            "Start": first_date.date(),
+            "End": last_date.date(),
+            "Trading Days": count + 1,
+            "First Close": first_close,
+            "Last Close": last_close,
+            "Mean Daily Return": mean,
+            "Daily Volatility": std,
+            "Annual Return": mean * TRADING_DAYS,
+            "Annual Volatility": std * np.sqrt(TRADING_DAYS),
+            "Worst Day": min_return,
+            "Best Day": max_return,
+        },
+    }
+
+def analyse_all(symbols, cache_dir, chunk_size=5000, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(analyse_symbol, symbols, [cache_dir] * len(symbols), [chunk_size] * len(symbols))
+        return [result for result in results if result is not None]
+
+
+### === FIGURES === ###
+def line_figure(results, column, title, y_title, log_y=False):
+    fig = go.Figure()
+    for result in results:
+        series = result["prices"][column] if column != "Volume" else result["volume"]
+        fig.add_trace(go.Scattergl(x=series.index, y=series, mode="lines", name=result["symbol"]))
+    fig.update_layout(title=title, xaxis_title="Date", yaxis_title=y_title, height=500)
+    if log_y:
+        fig.update_yaxes(type="log")
+    return fig
+
+def dropdown_figure(results, build_traces, title, x_title, y_title):
+    """One figure with a symbol selector instead of a subplot per stock"""
+    fig = go.Figure()
+    spans = []
+    for result in results:
+        start = len(fig.data)
+        for trace in build_traces(result):
+            fig.add_trace(trace)
+        spans.append((result["symbol"], start, len(fig.data)))
+
+    buttons = []
+    for symbol, start, stop in spans:
+        visible = [start <= i < stop for i in range(len(fig.data))]
+        buttons.append(dict(label=symbol, method="update", args=[{"visible": visible}]))
+    for i, trace in enumerate(fig.data):
+        trace.visible = spans[0][1] <= i < spans[0][2]
+
+    fig.update_layout(
+        title=title, xaxis_title=x_title, yaxis_title=y_title, height=500,
+        updatemenus=[dict(buttons=buttons, direction="down", x=1.0, xanchor="right", y=1.15, yanchor="top")]
+    )
+    return fig
+
+def moving_average_traces(result):
+    prices = result["prices"]
+    return [go.Scatter(x=prices.index, y=prices[column], mode="lines", name=f"{result['symbol']} {column}")
+            for column in ["Close"] + [f"MA {window}" for window in MA_WINDOWS]]
+
+def return_histogram_traces(result):
+    centres = (RETURN_BINS[:-1] + RETURN_BINS[1:]) / 2
+    return [go.Bar(x=centres, y=result["hist"], name=result["symbol"], marker_color="purple")]
+
+def correlation_figure(results):
+    # Weekly closes keep the aligned frame at ~52 rows per year of history
+    closes = pd.concat([result["prices"]["Close"].rename(result["symbol"]) for result in results], axis=1)
+    corr = closes.pct_change(fill_method=None).corr(min_periods=WEEKS_PER_YEAR)
+    fig = go.Figure(go.Heatmap(z=corr.values, x=corr.columns, y=corr.index, zmin=-1, zmax=1, colorscale="RdBu"))
+    fig.update_layout(title="Weekly Return Correlation", height=max(500, 14 * len(corr)))
+    return fig
+
+def risk_return_figure(stats):
+    fig = go.Figure(go.Scatter(
+        x=stats["Annual Volatility"], y=stats["Annual Return"], mode="markers+text",
+        text=stats.index, textposition="top center", marker=dict(size=10)
+    ))
+    fig.update_layout(title="Risk vs. Return", xaxis_title="Annual Volatility", yaxis_title="Annual Return",
+                      xaxis_tickformat=".0%", yaxis_tickformat=".0%", height=600)
+    return fig
+
+
+### === REPORT === ###
+def build_report(results):
+    stats = pd.DataFrame([result["stats"] for result in results], index=[result["symbol"] for result in results])
+    sections = [
+        ("Summary Statistics", stats.to_html(float_format=lambda x: f"{x:,.4f}", classes="stats")),
+        ("Closing Price History", line_figure(results, "Close", "Closing Price Over Time", "Close Price", log_y=True)),
+        ("Trading Volume", line_figure(results, "Volume", "Weekly Volume", "Volume")),
+        ("Moving Averages", dropdown_figure(results, moving_average_traces, "Close Price and Moving Averages", "Date", "Price")),
+        ("Daily Returns", dropdown_figure(results, return_histogram_traces, "Daily Return Distribution", "Daily Return", "Days")),
+        ("Correlation", correlation_figure(results)),
+        ("Risk vs. Return", risk_return_figure(stats)),
+    ]
+
+    body = []
+    include_plotlyjs = True
+    for heading, content in sections:
+        if isinstance(content, go.Figure):
+            # Embed plotly.js once so the report works offline
+            content = content.to_html(full_html=False, include_plotlyjs=include_plotlyjs)
+            include_plotlyjs = False
+        body.append(f"<h2>{heading}</h2>\n{content}")
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Stock Vision EDA Report</title>
+    <style>
+        body {{ font-family: sans-serif; margin: 30px; color: #2E3B55; }}
+        table.stats {{ border-collapse: collapse; font-size: 13px; }}
+        table.stats th, table.stats td {{ border: 1px solid #e1efff; padding: 4px 8px; text-align: right; }}
+        table.stats thead th {{ background-color: #0078ff; color: white; }}
+    </style>
+</head>
+<body>
+<h1>Stock Vision EDA Report 📊</h1>
+<p>{len(results)} symbols, generated {pd.Timestamp.now():%Y-%m-%d %H:%M}</p>
+{chr(10).join(body)}
+</body>
+</html>
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a static HTML EDA report for a list of stock symbols.")
+    parser.add_argument("symbols", nargs="*", help="Stock symbols, e.g. AAPL NVDA TSLA TCS.NS")
+    parser.add_argument("--symbols-file", help="Text file with one symbol per line")
+    parser.add_argument("--output", default="eda_report.html", help="Path of the HTML report")
+    parser.add_argument("--cache-dir", default="price_cache", help="Directory of cached price histories")
+    parser.add_argument("--refresh", action="store_true", help="Re-download histories already in the cache")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows read per chunk")
+    args = parser.parse_args()
+
+    symbols = [s.upper() for s in args.symbols]
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            symbols += [line.strip().upper() for line in f if line.strip()]
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        parser.error("no symbols given")
+
+    started = time.perf_counter()
+    available = fill_cache(symbols, args.cache_dir, args.refresh)
+    results = analyse_all(available, args.cache_dir, args.chunk_size, args.workers)
+    missing = sorted(set(symbols) - {result["symbol"] for result in results})
+    if missing:
+        print(f"No data found for: {', '.join(missing)}")
+    if not results:
+        raise SystemExit("No symbols had enough data for a report.")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(build_report(results))
+    print(f"Wrote {args.output} for {len(results)} symbols in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()